@@ -19,11 +19,101 @@ import sys
 import re
 import os
 import platform
-from typing import Dict, List, Set, Tuple, Optional
-from urllib.parse import urlparse
+import pickle
+import random
+import threading
+import time
+from collections import defaultdict
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, NamedTuple, Set, Tuple, Optional
+from urllib.parse import urlparse, parse_qs
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 
+# orjson is an optional, faster drop-in for parsing package.json files and
+# the large GitHub commit listings and commit details
+try:
+    import orjson
+    
+    def _loads(data: bytes):
+        # orjson rejects a leading UTF-8 BOM, which json.loads accepts on bytes
+        return orjson.loads(data[3:] if data[:3] == b'\xef\xbb\xbf' else data)
+except ImportError:
+    _loads = json.loads
+
+
+# Cap on concurrent NPM registry lookups; higher values start tripping
+# the registry's throttling (429s and redirects).
+NPM_CHECK_WORKERS = 20
+
+# Cap on concurrent page fetches from a single paginated GitHub listing.
+GITHUB_PAGE_WORKERS = 8
+
+# Repositories whose commit and branch listings are collected at once; each
+# one fans its pages out further on its own GITHUB_PAGE_WORKERS pool
+GITHUB_REPO_WORKERS = 4
+
+# Workers shared by all repositories when analyzing files and commits, and
+# how often a request rejected by a GitHub rate limit is retried
+GITHUB_ANALYSIS_WORKERS = 16
+RATE_LIMIT_RETRIES = 3
+
+# Cap on GitHub API requests in flight across all pools, nested ones included,
+# to stay clear of the secondary rate limit's concurrency checks
+GITHUB_MAX_IN_FLIGHT = 16
+
+# Once fewer GitHub API calls than RATE_LIMIT_PACE_BELOW remain, requests are
+# spaced out so the rest of the quota lasts until it resets; below
+# RATE_LIMIT_RESERVE, wait for the reset outright
+RATE_LIMIT_PACE_BELOW = 1000
+RATE_LIMIT_RESERVE = 100
+
+# Minimum seconds between redraws of an in-place progress line
+PROGRESS_INTERVAL = 0.1
+
+# Horizontal rules framing report sections
+_HR100 = '=' * 100
+_HR80 = '=' * 80
+_HR60 = '=' * 60
+
+# Where GitHub API responses are kept between runs for ETag revalidation,
+# and the total size of response bodies kept, least recently used dropped first
+ETAG_CACHE_FILE = Path.home() / '.cache' / 'deponpm' / 'etags.pickle'
+ETAG_CACHE_MAX_BYTES = 32 * 1024 * 1024
+ETAG_CACHE_VERSION = 1
+
+# Dependencies found per commit, stored next to the response cache. Bump the
+# version whenever the patch parser's output changes, so results from an
+# older parser are discarded instead of served
+COMMIT_CACHE_NAME = 'commit_deps.pickle'
+COMMIT_CACHE_MAX_ENTRIES = 50000
+COMMIT_CACHE_VERSION = 1
+
+# Path part of a GitHub file URL, after the https://github.com/ prefix
+_GITHUB_PREFIX = 'https://github.com/'
+_GITHUB_BLOB_RE = re.compile(r'([^/]+)/([^/]+)/blob/([^/]+)/(.+)')
+
+# package.json sections whose keys are NPM package names
+DEPENDENCY_SECTIONS = ('dependencies', 'devDependencies', 'peerDependencies')
+
+# Files whose changes mark a commit as touching dependencies
+_DEP_SUFFIXES = ('package.json', 'package-lock.json', 'yarn.lock')
+
+# Patch parsing: the only lines that matter are hunk headers, changed
+# `"name": "version"` entries, and lines that open or close a block; the rest
+# are skipped by the regex engine. Also the key that opens a JSON line, and
+# string literals (stripped before counting braces)
+_PATCH_EVENT_RE = re.compile(
+    r'^(?:@@.*'
+    r'|[+-][ \t]*"(?P<dep>[^"\n]+)"[ \t]*:[ \t]*"[^"\n]*"[ \t]*,?[ \t\r]*'
+    r'|[ +-][^\n{}]*[{}].*)$',
+    re.MULTILINE)
+_JSON_KEY_RE = re.compile(r'^\s*"([^"]+)"\s*:')
+_JSON_STRING_RE = re.compile(r'"(?:[^"\\]|\\.)*"')
+
 
 def print_banner():
     """Print the DEPONPM banner."""
@@ -44,20 +134,326 @@ def print_banner():
     print(banner)
 
 
+class CommitInfo(NamedTuple):
+    """Summary of one commit from a GitHub commit listing."""
+    sha: str
+    message: str
+    author: str
+    date: str
+    url: str
+    
+    @classmethod
+    def from_api(cls, commit: Dict) -> 'CommitInfo':
+        """Build a record from a commit object returned by the GitHub API."""
+        return cls(commit['sha'], commit['commit']['message'],
+                   commit['commit']['author']['name'],
+                   commit['commit']['author']['date'], commit['html_url'])
+
+
 class DEPONPM:
     """Main class for checking NPM dependencies."""
     
-    def __init__(self, github_token: Optional[str] = None):
+    def __init__(self, github_token: Optional[str] = None,
+                 cache_file: Optional[Path] = ETAG_CACHE_FILE):
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'DEPONPM/1.0'
+            'User-Agent': 'DEPONPM/1.0',
+            'Accept-Encoding': 'gzip, deflate'
         })
+        
+        # Size the connection pool for the concurrent workers so they share
+        # kept-alive connections instead of queueing for new handshakes
+        retries = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retries)
+        self.session.mount('https://', adapter)
+        
+        # GitHub API rate limits (403/429 with Retry-After) are handled by
+        # _github_get outside its in-flight slot, so the API's adapter only
+        # retries transient server errors
+        github_retries = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=False,
+            raise_on_status=False
+        )
+        self.session.mount('https://api.github.com/',
+                           HTTPAdapter(pool_connections=1, pool_maxsize=GITHUB_MAX_IN_FLIGHT,
+                                       max_retries=github_retries))
+        
+        # Watch GitHub's quota headers on every API response: last seen
+        # (remaining, reset epoch), and the earliest time of the next paced call
+        self._rate_limit_lock = threading.Lock()
+        self._rate_limit_state: Optional[Tuple[int, int]] = None
+        self._next_github_slot = 0.0
+        self._github_slots = threading.BoundedSemaphore(GITHUB_MAX_IN_FLIGHT)
         self.github_token = github_token
+        
+        # NPM lookups keyed by package name, shared by every repo in a run
+        self._npm_cache: Dict[str, Tuple[bool, str]] = {}
+        
+        # GitHub API responses keyed by full URL: (etag, body, link header).
+        # Both on-disk caches are only read once a GitHub lookup needs them
+        self.cache_file = cache_file
+        self._cache_load_lock = threading.Lock()
+        self._etag_lock = threading.Lock()
+        self._etag_entries: Optional[Dict[str, Tuple[str, bytes, Optional[str]]]] = None
+        self._etag_cache_bytes = 0
+        
+        # Dependencies added per (repo full name, commit SHA); commits are
+        # immutable, so a SHA seen in this or an earlier run is only fetched once
+        self.commit_cache_file = cache_file.with_name(COMMIT_CACHE_NAME) if cache_file else None
+        self._commit_dep_entries: Optional[Dict[Tuple[str, str], List[str]]] = None
+        
         if github_token:
             self.session.headers.update({
                 'Authorization': f'token {github_token}'
             })
     
+    @property
+    def _etag_cache(self) -> Dict[str, Tuple[str, bytes, Optional[str]]]:
+        """GitHub API responses cached by earlier runs, loaded on first use."""
+        if self._etag_entries is None:
+            with self._cache_load_lock:
+                if self._etag_entries is None:
+                    entries = self._load_cache(self.cache_file, ETAG_CACHE_VERSION)
+                    self._etag_cache_bytes = sum(len(entry[1]) for entry in entries.values())
+                    self._trim_etag_cache(entries)
+                    self._etag_entries = entries
+        return self._etag_entries
+    
+    def _trim_etag_cache(self, cache: Dict[str, Tuple[str, bytes, Optional[str]]]):
+        """Drop the least recently used responses until the cache fits its size limit."""
+        while self._etag_cache_bytes > ETAG_CACHE_MAX_BYTES and cache:
+            oldest = next(iter(cache))
+            self._etag_cache_bytes -= len(cache.pop(oldest)[1])
+    
+    def _remember_etag(self, key: str, entry: Tuple[str, bytes, Optional[str]]):
+        """
+        Store a response as the most recently used cache entry.
+        
+        Args:
+            key: Full request URL
+            entry: Tuple of (etag, body, link header)
+        """
+        cache = self._etag_cache
+        with self._etag_lock:
+            previous = cache.pop(key, None)
+            if previous:
+                self._etag_cache_bytes -= len(previous[1])
+            cache[key] = entry
+            self._etag_cache_bytes += len(entry[1])
+            self._trim_etag_cache(cache)
+    
+    @property
+    def _commit_dep_cache(self) -> Dict[Tuple[str, str], List[str]]:
+        """Dependencies found per commit by earlier runs, loaded on first use."""
+        if self._commit_dep_entries is None:
+            with self._cache_load_lock:
+                if self._commit_dep_entries is None:
+                    self._commit_dep_entries = self._load_cache(self.commit_cache_file,
+                                                                 COMMIT_CACHE_VERSION)
+        return self._commit_dep_entries
+    
+    def _load_cache(self, cache_file: Optional[Path], version: int) -> Dict:
+        """
+        Load a cache dictionary written by a previous run.
+        
+        Args:
+            cache_file: Pickle file to read, or None when caching is disabled
+            version: Format version the entries must have been written with
+            
+        Returns:
+            Cache dictionary, empty if there is no usable cache file
+        """
+        if not cache_file:
+            return {}
+        
+        try:
+            with open(cache_file, 'rb') as f:
+                stored = pickle.load(f)
+            if not isinstance(stored, dict) or stored.get('version') != version:
+                return {}
+            cache = stored.get('entries')
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            return {}
+    
+    def _save_cache(self, cache_file: Optional[Path], cache: Optional[Dict], version: int,
+                    max_entries: Optional[int] = None):
+        """
+        Atomically write a cache dictionary to disk for the next run.
+        
+        Only the newest entries are kept. The directory and file are
+        private to the user, since they can hold private repository data.
+        
+        Args:
+            cache_file: Pickle file to write, or None when caching is disabled
+            cache: Cache dictionary to write, or None if it was never loaded
+            version: Format version stored alongside the entries
+            max_entries: Most entries to keep, oldest dropped first; None
+                for a cache that is already bounded
+        """
+        if not cache_file or not cache:
+            return
+        
+        if max_entries is not None and len(cache) > max_entries:
+            cache = dict(list(cache.items())[-max_entries:])
+        
+        try:
+            cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if cache_file.parent == ETAG_CACHE_FILE.parent:
+                # Also tighten our own directory if an older version created it
+                os.chmod(cache_file.parent, 0o700)
+            tmp_file = cache_file.with_suffix('.tmp')
+            if tmp_file.exists():
+                tmp_file.unlink()
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump({'version': version, 'entries': cache}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            print(f"Warning: could not write cache file {cache_file}: {e}", file=sys.stderr)
+    
+    def save_cache(self):
+        """Write cached GitHub API responses and commit dependencies to disk."""
+        self._save_cache(self.cache_file, self._etag_entries, ETAG_CACHE_VERSION)
+        self._save_cache(self.commit_cache_file, self._commit_dep_entries,
+                         COMMIT_CACHE_VERSION, COMMIT_CACHE_MAX_ENTRIES)
+    
+    def _track_rate_limit(self, response: requests.Response, *args, **kwargs):
+        """
+        Record the GitHub API quota, pausing when it is nearly used up.
+        
+        Called by _github_get for GitHub API responses only; responses
+        without usable rate limit headers are ignored.
+        
+        Args:
+            response: Response that was just received
+        """
+        try:
+            remaining = int(response.headers['X-RateLimit-Remaining'])
+            reset = int(response.headers['X-RateLimit-Reset'])
+        except (KeyError, ValueError):
+            return
+        
+        # One worker waits out the reset; the others queue on the lock and then
+        # find the reset time already behind them
+        with self._rate_limit_lock:
+            self._rate_limit_state = (remaining, reset)
+            if remaining >= RATE_LIMIT_RESERVE:
+                return
+            
+            wait = reset - time.time()
+            if wait > 0:
+                print(f"GitHub rate limit nearly exhausted ({remaining} calls left), "
+                      f"waiting {wait:.0f}s for reset...", file=sys.stderr)
+                time.sleep(wait)
+    
+    def _pace_github_request(self):
+        """
+        Wait for this request's slot when the GitHub API quota is running low.
+        
+        Slots are handed out evenly over the time left until the quota
+        resets, so a long run slows down instead of hitting the limit.
+        """
+        with self._rate_limit_lock:
+            if self._rate_limit_state is None:
+                return
+            
+            remaining, reset = self._rate_limit_state
+            now = time.time()
+            if remaining >= RATE_LIMIT_PACE_BELOW or reset <= now:
+                return
+            
+            interval = (reset - now) / max(remaining - RATE_LIMIT_RESERVE, 1)
+            slot = max(self._next_github_slot, now)
+            self._next_github_slot = slot + interval
+        
+        if slot > now:
+            time.sleep(slot - now)
+    
+    def _is_rate_limited(self, response: requests.Response) -> bool:
+        """
+        Check whether GitHub rejected a request under one of its rate limits.
+        
+        Args:
+            response: Response to inspect
+            
+        Returns:
+            True if the request should be retried after a pause
+        """
+        if response.status_code not in (403, 429):
+            return False
+        return ('Retry-After' in response.headers or
+                response.headers.get('X-RateLimit-Remaining') == '0' or
+                b'rate limit' in response.content)
+    
+    def _github_get(self, url: str, params: Optional[Dict] = None, timeout: int = 30,
+                    cache: bool = True) -> requests.Response:
+        """
+        GET a GitHub API resource, revalidating cached copies with ETags.
+        
+        A 304 Not Modified doesn't count against the rate limit; it is
+        answered with the cached body so callers see a normal 200.
+        At most GITHUB_MAX_IN_FLIGHT requests run at once. Requests are
+        paced when the quota runs low, and requests rejected by a rate
+        limit are retried with jittered exponential backoff. Pacing, quota
+        waits and rate-limit backoff all happen without holding an
+        in-flight slot; only the adapter's short retries of 5xx errors do.
+        
+        Args:
+            url: API endpoint URL
+            params: Query parameters
+            timeout: Request timeout in seconds
+            cache: Whether to keep the response for revalidation; off for
+                bodies that are only read once
+            
+        Returns:
+            Response for the resource
+        """
+        key = requests.Request('GET', url, params=params).prepare().url
+        cached = self._etag_cache.get(key) if cache else None
+        headers = {'If-None-Match': cached[0]} if cached else None
+        
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            self._pace_github_request()
+            with self._github_slots:
+                response = self.session.get(url, params=params, headers=headers, timeout=timeout)
+            self._track_rate_limit(response)
+            if attempt == RATE_LIMIT_RETRIES or not self._is_rate_limited(response):
+                break
+            
+            # Honour Retry-After; an exhausted primary quota has already been
+            # waited out by _track_rate_limit. Jitter keeps workers apart
+            if 'Retry-After' in response.headers:
+                delay = float(response.headers['Retry-After'])
+            elif response.headers.get('X-RateLimit-Remaining') == '0':
+                delay = 0.0
+            else:
+                delay = 2.0 ** attempt
+            time.sleep(delay + random.uniform(0, 1))
+        
+        if response.status_code == 304 and cached:
+            response.status_code = 200
+            response._content = cached[1]
+            if cached[2]:
+                response.headers['Link'] = cached[2]
+            self._remember_etag(key, cached)
+        elif cache and response.status_code == 200 and response.headers.get('ETag'):
+            self._remember_etag(key, (response.headers['ETag'], response.content,
+                                      response.headers.get('Link')))
+        
+        return response
+    
     def fetch_github_raw_url(self, github_url: str) -> str:
         """
         Convert GitHub URL to raw file URL.
@@ -68,9 +464,9 @@ class DEPONPM:
         Returns:
             Raw file URL
         """
-        # Pattern to match GitHub URLs
-        pattern = r'https://github\.com/([^/]+)/([^/]+)/blob/([^/]+)/(.+)'
-        match = re.match(pattern, github_url)
+        match = None
+        if github_url.startswith(_GITHUB_PREFIX):
+            match = _GITHUB_BLOB_RE.fullmatch(github_url[len(_GITHUB_PREFIX):])
         
         if not match:
             raise ValueError(f"Invalid GitHub URL format: {github_url}")
@@ -94,7 +490,9 @@ class DEPONPM:
             response.raise_for_status()
             
             try:
-                return json.loads(response.text)
+                # Parse the raw body; json detects the UTF encoding itself, which
+                # skips requests' charset guessing on the decoded text
+                return _loads(response.content)
             except json.JSONDecodeError as e:
                 raise ValueError(f"Invalid JSON in package.json: {e}")
                 
@@ -140,11 +538,10 @@ class DEPONPM:
         dependencies = set()
         
         # Check different dependency types
-        dependency_types = ['dependencies', 'devDependencies', 'peerDependencies']
-        
-        for dep_type in dependency_types:
-            if dep_type in package_data and isinstance(package_data[dep_type], dict):
-                dependencies.update(package_data[dep_type].keys())
+        for dep_type in DEPENDENCY_SECTIONS:
+            section = package_data.get(dep_type)
+            if type(section) is dict:
+                dependencies |= section.keys()
         
         return dependencies
     
@@ -158,20 +555,90 @@ class DEPONPM:
         Returns:
             Tuple of (exists, status_message)
         """
+        cached = self._npm_cache.get(package_name)
+        if cached is not None:
+            return cached
+        
         registry_url = f"https://registry.npmjs.com/{package_name}"
         
         try:
-            response = self.session.get(registry_url, timeout=10)
+            # Only the status code matters, so skip downloading the packument
+            response = self.session.head(registry_url, timeout=10, allow_redirects=True)
             
             if response.status_code == 200:
-                return True, "Package exists"
+                result = True, "Package exists"
             elif response.status_code == 404:
-                return False, "Package not found"
+                result = False, "Package not found"
             else:
                 return False, f"Unexpected status: {response.status_code}"
                 
         except requests.RequestException as e:
             return False, f"Request failed: {e}"
+        
+        # Only definitive answers are cached; transient failures get retried
+        self._npm_cache[package_name] = result
+        return result
+    
+    def _check_one(self, dep_name: str) -> Tuple[str, bool, str]:
+        """
+        Check a single dependency against NPM registry.
+        
+        Args:
+            dep_name: Name of the package to check
+            
+        Returns:
+            Tuple of (dep_name, exists, status_message)
+        """
+        exists, status = self.check_npm_package_exists(dep_name)
+        return dep_name, exists, status
+    
+    def check_package_names(self, names: Set[str], prefix: str = "",
+                            ok_label: str = "OK", fail_label: str = "FAIL") -> Dict[str, Dict]:
+        """
+        Check a set of package names against NPM registry concurrently.
+        
+        Progress is redrawn in place on a terminal, followed by one summary
+        line; per-package outcomes are in the returned results.
+        
+        Args:
+            names: Package names to check
+            prefix: Indentation for progress lines
+            ok_label: Summary label for packages that exist
+            fail_label: Summary label for packages that don't exist
+            
+        Returns:
+            Dictionary with dependency check results, in sorted name order
+        """
+        dep_names = sorted(names)
+        total = len(dep_names)
+        checked = {}
+        failed = 0
+        interactive = sys.stdout.isatty()
+        last_draw = 0.0
+        
+        with ThreadPoolExecutor(max_workers=NPM_CHECK_WORKERS) as executor:
+            futures = [executor.submit(self._check_one, dep_name) for dep_name in dep_names]
+            
+            for done, future in enumerate(as_completed(futures), 1):
+                dep_name, exists, status = future.result()
+                checked[dep_name] = {
+                    'exists': exists,
+                    'status': status
+                }
+                if not exists:
+                    failed += 1
+                
+                now = time.monotonic()
+                if interactive and (done == total or now - last_draw >= PROGRESS_INTERVAL):
+                    sys.stdout.write(f"\r{prefix}[{done}/{total}] checked")
+                    sys.stdout.flush()
+                    last_draw = now
+        
+        if interactive and total:
+            sys.stdout.write("\n")
+        print(f"{prefix}{total - failed} {ok_label}, {failed} {fail_label}")
+        
+        return {dep_name: checked[dep_name] for dep_name in dep_names}
     
     def check_dependencies(self, package_data: Dict) -> Dict[str, Dict]:
         """
@@ -184,22 +651,10 @@ class DEPONPM:
             Dictionary with dependency check results
         """
         dependencies = self.extract_dependencies(package_data)
-        results = {}
         
         print(f"Checking {len(dependencies)} dependencies...")
         
-        for i, dep_name in enumerate(sorted(dependencies), 1):
-            print(f"[{i}/{len(dependencies)}] Checking {dep_name}...", end=' ')
-            
-            exists, status = self.check_npm_package_exists(dep_name)
-            results[dep_name] = {
-                'exists': exists,
-                'status': status
-            }
-            
-            print("OK" if exists else "FAIL")
-        
-        return results
+        return self.check_package_names(dependencies)
     
     def read_urls_from_file(self, file_path: str) -> List[str]:
         """
@@ -219,13 +674,10 @@ class DEPONPM:
         if not path.is_file():
             raise ValueError(f"Path is not a file: {file_path}")
         
-        urls = []
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if line and not line.startswith('#'):  # Skip empty lines and comments
-                        urls.append(line)
+            # Split the whole file in one pass rather than iterating line objects
+            lines = map(str.strip, path.read_text(encoding='utf-8').splitlines())
+            urls = [line for line in lines if line and not line.startswith('#')]  # Skip empty lines and comments
         except Exception as e:
             raise ValueError(f"Failed to read file {file_path}: {e}")
         
@@ -234,6 +686,74 @@ class DEPONPM:
         
         return urls
     
+    def _fetch_page(self, url: str, params: Dict, page: int) -> requests.Response:
+        """
+        Fetch a single page of a paginated GitHub API endpoint.
+        
+        Args:
+            url: API endpoint URL
+            params: Query parameters, without the page number
+            page: Page number to fetch
+            
+        Returns:
+            Successful response for the page
+        """
+        response = self._github_get(url, params=dict(params, page=page), timeout=30)
+        response.raise_for_status()
+        return response
+    
+    def _iter_pages(self, url: str, params: Dict, max_pages: Optional[int] = None):
+        """
+        Iterate over the pages of a paginated GitHub API endpoint.
+        
+        The first page is fetched on its own to learn the page count from
+        its Link header; the remaining pages are then fetched concurrently
+        and yielded in order. Without a page count, next links are
+        followed one page at a time.
+        
+        Args:
+            url: API endpoint URL
+            params: Query parameters, without the page number
+            max_pages: Maximum number of pages to fetch
+            
+        Yields:
+            List of items from each non-empty page
+            
+        Raises:
+            requests.RequestException: If a page cannot be fetched
+        """
+        response = self._fetch_page(url, params, 1)
+        items = _loads(response.content)
+        if not items:
+            return
+        yield items
+        
+        last_url = response.links.get('last', {}).get('url')
+        if not last_url:
+            # No page count advertised, so only fetch pages known to exist
+            page = 1
+            while 'next' in response.links and (max_pages is None or page < max_pages):
+                page += 1
+                response = self._fetch_page(url, params, page)
+                items = _loads(response.content)
+                if not items:
+                    return
+                yield items
+            return
+        
+        last_page = int(parse_qs(urlparse(last_url).query)['page'][0])
+        if max_pages is not None:
+            last_page = min(last_page, max_pages)
+        
+        with ThreadPoolExecutor(max_workers=GITHUB_PAGE_WORKERS) as executor:
+            pages = executor.map(lambda page: self._fetch_page(url, params, page),
+                                 range(2, last_page + 1))
+            for response in pages:
+                items = _loads(response.content)
+                if not items:
+                    return
+                yield items
+    
     def get_github_repositories(self, org_name: str) -> List[Dict]:
         """
         Get all repositories from a GitHub organization.
@@ -248,28 +768,18 @@ class DEPONPM:
             raise ValueError("GitHub token is required for organization access")
         
         repos = []
-        page = 1
         per_page = 100
         
         print(f"Fetching repositories from organization: {org_name}")
         
-        while True:
-            url = f"https://api.github.com/orgs/{org_name}/repos"
-            params = {
-                'page': page,
-                'per_page': per_page,
-                'type': 'all'  # Include both public and private repos
-            }
-            
-            try:
-                response = self.session.get(url, params=params, timeout=30)
-                response.raise_for_status()
-                
-                page_repos = response.json()
-                
-                if not page_repos:
-                    break
-                
+        url = f"https://api.github.com/orgs/{org_name}/repos"
+        params = {
+            'per_page': per_page,
+            'type': 'all'  # Include both public and private repos
+        }
+        
+        try:
+            for page_repos in self._iter_pages(url, params):
                 for repo in page_repos:
                     repo_info = {
                         'name': repo['name'],
@@ -281,10 +791,8 @@ class DEPONPM:
                     }
                     repos.append(repo_info)
                 
-                page += 1
-                
-            except requests.RequestException as e:
-                raise ValueError(f"Failed to fetch repositories from organization {org_name}: {e}")
+        except (requests.RequestException, ValueError) as e:
+            raise ValueError(f"Failed to fetch repositories from organization {org_name}: {e}")
         
         print(f"Found {len(repos)} repositories")
         return repos
@@ -300,38 +808,36 @@ class DEPONPM:
             Parsed package.json as dictionary, or None if not found
         """
         try:
+            if not repo_info['private']:
+                # Public repos are served raw without touching the API rate limit
+                raw_url = f"https://raw.githubusercontent.com/{repo_info['full_name']}/{repo_info['default_branch']}/package.json"
+                response = self.session.get(raw_url, timeout=30)
+                
+                if response.status_code == 200:
+                    return _loads(response.content)
+                elif response.status_code == 404:
+                    return None
+                else:
+                    print(f"  Error accessing repository {repo_info['name']}: HTTP {response.status_code}")
+                    return None
+            
             # Try to get package.json from the default branch
             url = f"https://api.github.com/repos/{repo_info['full_name']}/contents/package.json"
             params = {'ref': repo_info['default_branch']}
             
-            response = self.session.get(url, params=params, timeout=30)
+            response = self._github_get(url, params=params, timeout=30)
             
             if response.status_code == 200:
                 content_data = response.json()
                 if content_data.get('type') == 'file':
                     # Decode base64 content
                     import base64
-                    content = base64.b64decode(content_data['content']).decode('utf-8')
-                    package_data = json.loads(content)
+                    content = base64.b64decode(content_data['content'])
+                    package_data = _loads(content)
                     return package_data
             
             elif response.status_code == 404:
-                # package.json not found in root, try to find it
-                url = f"https://api.github.com/repos/{repo_info['full_name']}/contents"
-                params = {'ref': repo_info['default_branch']}
-                
-                response = self.session.get(url, params=params, timeout=30)
-                
-                if response.status_code == 200:
-                    contents = response.json()
-                    for item in contents:
-                        if item.get('name') == 'package.json' and item.get('type') == 'file':
-                            # Found package.json, fetch its content
-                            content_response = self.session.get(item['download_url'], timeout=30)
-                            if content_response.status_code == 200:
-                                package_data = json.loads(content_response.text)
-                                return package_data
-                
+                # No package.json at the repository root
                 return None
             else:
                 print(f"  Error accessing repository {repo_info['name']}: HTTP {response.status_code}")
@@ -355,27 +861,33 @@ class DEPONPM:
             Dictionary mapping repository names to their dependency results
         """
         repos = self.get_github_repositories(org_name)
-        all_results = {}
+        repo_dependencies = {}  # repo name -> dependency names
         
         print(f"\nProcessing {len(repos)} repositories...")
         
-        for i, repo_info in enumerate(repos, 1):
-            print(f"\n[{i}/{len(repos)}] Processing repository: {repo_info['name']}")
-            
-            package_data = self.fetch_package_json_from_repo(repo_info)
+        with ThreadPoolExecutor(max_workers=GITHUB_ANALYSIS_WORKERS) as executor:
+            packages = executor.map(self.fetch_package_json_from_repo, repos)
             
-            if package_data:
-                print(f"  Found package.json - {package_data.get('name', 'Unknown')} v{package_data.get('version', 'Unknown')}")
+            for i, (repo_info, package_data) in enumerate(zip(repos, packages), 1):
+                print(f"\n[{i}/{len(repos)}] Processing repository: {repo_info['name']}")
                 
-                # Check dependencies
-                results = self.check_dependencies(package_data)
-                all_results[repo_info['name']] = results
-            else:
-                print(f"  No package.json found")
+                if package_data:
+                    print(f"  Found package.json - {package_data.get('name', 'Unknown')} v{package_data.get('version', 'Unknown')}")
+                    repo_dependencies[repo_info['name']] = self.extract_dependencies(package_data)
+                else:
+                    print(f"  No package.json found")
         
-        return all_results
+        # Check every dependency once, however many repositories share it
+        unique_deps = set().union(*repo_dependencies.values())
+        print(f"\nChecking {len(unique_deps)} unique dependencies from {len(repo_dependencies)} repositories...")
+        checked = self.check_package_names(unique_deps)
+        
+        return {
+            repo_name: {dep_name: checked[dep_name] for dep_name in sorted(deps)}
+            for repo_name, deps in repo_dependencies.items()
+        }
     
-    def get_repository_commits(self, repo_info: Dict, since_days: int = 365) -> List[Dict]:
+    def get_repository_commits(self, repo_info: Dict, since_days: int = 365) -> List[CommitInfo]:
         """
         Get commit history for a repository.
         
@@ -384,10 +896,9 @@ class DEPONPM:
             since_days: Number of days to look back for commits
             
         Returns:
-            List of commit information dictionaries
+            List of CommitInfo records
         """
         commits = []
-        page = 1
         per_page = 100
         
         # Calculate since date
@@ -395,46 +906,21 @@ class DEPONPM:
         since_date = datetime.now() - timedelta(days=since_days)
         since_str = since_date.strftime('%Y-%m-%dT%H:%M:%SZ')
         
-        print(f"  Fetching commits from {since_date.strftime('%Y-%m-%d')}...")
+        url = f"https://api.github.com/repos/{repo_info['full_name']}/commits"
+        params = {
+            'per_page': per_page,
+            'since': since_str
+        }
         
-        while True:
-            url = f"https://api.github.com/repos/{repo_info['full_name']}/commits"
-            params = {
-                'page': page,
-                'per_page': per_page,
-                'since': since_str
-            }
-            
-            try:
-                response = self.session.get(url, params=params, timeout=30)
-                response.raise_for_status()
-                
-                page_commits = response.json()
-                
-                if not page_commits:
-                    break
-                
+        try:
+            # Limit to prevent excessive API calls
+            for page_commits in self._iter_pages(url, params, max_pages=1000 // per_page):
                 for commit in page_commits:
-                    commit_info = {
-                        'sha': commit['sha'],
-                        'message': commit['commit']['message'],
-                        'author': commit['commit']['author']['name'],
-                        'date': commit['commit']['author']['date'],
-                        'url': commit['html_url']
-                    }
-                    commits.append(commit_info)
-                
-                page += 1
+                    commits.append(CommitInfo.from_api(commit))
                 
-                # Limit to prevent excessive API calls
-                if len(commits) >= 1000:
-                    break
-                    
-            except requests.RequestException as e:
-                print(f"  Error fetching commits: {e}")
-                break
+        except (requests.RequestException, ValueError) as e:
+            print(f"  Error fetching commits: {e}")
         
-        print(f"  Found {len(commits)} commits")
         return commits
     
     def analyze_commit_for_dependencies(self, repo_info: Dict, commit_sha: str) -> Optional[Dict]:
@@ -451,17 +937,17 @@ class DEPONPM:
         try:
             # Get commit details
             url = f"https://api.github.com/repos/{repo_info['full_name']}/commits/{commit_sha}"
-            response = self.session.get(url, timeout=30)
+            response = self._github_get(url, timeout=30, cache=False)
             response.raise_for_status()
             
-            commit_data = response.json()
+            commit_data = _loads(response.content)
             
             # Look for package.json changes in the commit
             package_json_changes = []
             
             for file_change in commit_data.get('files', []):
                 filename = file_change.get('filename', '')
-                if filename.endswith('package.json') or filename.endswith('package-lock.json') or filename.endswith('yarn.lock'):
+                if filename.endswith(_DEP_SUFFIXES):
                     change_info = {
                         'filename': filename,
                         'status': file_change.get('status', ''),
@@ -484,10 +970,31 @@ class DEPONPM:
             
             return None
             
-        except requests.RequestException as e:
+        except (requests.RequestException, ValueError) as e:
             print(f"    Error analyzing commit {commit_sha}: {e}")
             return None
     
+    def _fetch_branch_commits(self, repo_info: Dict, branch_name: str) -> List[Dict]:
+        """
+        Get the most recent commits of a branch.
+        
+        Args:
+            repo_info: Repository information dictionary
+            branch_name: Name of the branch
+            
+        Returns:
+            List of raw commit objects, empty if the branch can't be read
+        """
+        url = f"https://api.github.com/repos/{repo_info['full_name']}/commits"
+        params = {'sha': branch_name, 'per_page': 100}
+        
+        try:
+            response = self._github_get(url, params=params, timeout=30)
+            response.raise_for_status()
+            return _loads(response.content)
+        except (requests.RequestException, ValueError):
+            return []
+    
     def get_deleted_commits(self, repo_info: Dict) -> List[Dict]:
         """
         Get information about deleted commits (commits that are no longer in the main branch).
@@ -503,57 +1010,41 @@ class DEPONPM:
         try:
             # Get all branches
             url = f"https://api.github.com/repos/{repo_info['full_name']}/branches"
-            response = self.session.get(url, timeout=30)
+            response = self._github_get(url, timeout=30)
             response.raise_for_status()
             
             branches = response.json()
             
             # Get commits from all branches
-            all_commits = set()
-            branch_commits = {}
-            
-            for branch in branches:
-                branch_name = branch['name']
-                branch_url = f"https://api.github.com/repos/{repo_info['full_name']}/commits"
-                params = {'sha': branch_name, 'per_page': 100}
-                
-                try:
-                    branch_response = self.session.get(branch_url, params=params, timeout=30)
-                    branch_response.raise_for_status()
-                    commits = branch_response.json()
-                    
-                    branch_commits[branch_name] = commits
-                    for commit in commits:
-                        all_commits.add(commit['sha'])
-                        
-                except requests.RequestException:
-                    continue
-            
-            # Find commits that might be "deleted" (not in main branch)
             main_branch = repo_info['default_branch']
             main_commits = set()
-            
-            if main_branch in branch_commits:
-                for commit in branch_commits[main_branch]:
-                    main_commits.add(commit['sha'])
+            # sha -> deleted commit record, first non-default branch wins. Only
+            # the reported fields are kept, not the full commit payloads
+            candidates = {}
+            
+            branch_names = [branch['name'] for branch in branches]
+            with ThreadPoolExecutor(max_workers=GITHUB_PAGE_WORKERS) as executor:
+                branch_listings = executor.map(
+                    lambda branch_name: self._fetch_branch_commits(repo_info, branch_name),
+                    branch_names)
+                
+                for branch_name, commits in zip(branch_names, branch_listings):
+                    for commit in commits:
+                        if branch_name == main_branch:
+                            main_commits.add(commit['sha'])
+                        elif commit['sha'] not in candidates:
+                            candidates[commit['sha']] = {
+                                'sha': commit['sha'],
+                                'message': commit['commit']['message'],
+                                'date': commit['commit']['author']['date'],
+                                'author': commit['commit']['author']['name'],
+                                'branch': branch_name,
+                                'url': commit['html_url']
+                            }
             
             # Commits not in main branch could be considered "deleted"
-            for commit_sha in all_commits:
-                if commit_sha not in main_commits:
-                    # Find which branch this commit is in
-                    for branch_name, commits in branch_commits.items():
-                        if branch_name != main_branch:
-                            for commit in commits:
-                                if commit['sha'] == commit_sha:
-                                    deleted_commits.append({
-                                        'sha': commit_sha,
-                                        'message': commit['commit']['message'],
-                                        'date': commit['commit']['author']['date'],
-                                        'author': commit['commit']['author']['name'],
-                                        'branch': branch_name,
-                                        'url': commit['html_url']
-                                    })
-                                    break
+            deleted_commits = [info for commit_sha, info in candidates.items()
+                               if commit_sha not in main_commits]
             
         except requests.RequestException as e:
             print(f"  Error fetching deleted commits: {e}")
@@ -579,8 +1070,6 @@ class DEPONPM:
             'total_commits_analyzed': 0
         }
         
-        print(f"  Performing comprehensive analysis...")
-        
         # Get current package.json
         current_package = self.fetch_package_json_from_repo(repo_info)
         if current_package:
@@ -593,13 +1082,15 @@ class DEPONPM:
         
         # Analyze recent commits for dependency changes
         dependency_changes = []
-        for i, commit in enumerate(commits[:50]):  # Limit to last 50 commits for performance
-            if i % 10 == 0:
-                print(f"    Analyzing commit {i+1}/{min(50, len(commits))}...")
+        recent_commits = commits[:50]  # Limit to last 50 commits for performance
+        with ThreadPoolExecutor(max_workers=GITHUB_ANALYSIS_WORKERS) as executor:
+            commit_analyses = executor.map(
+                lambda commit: self.analyze_commit_for_dependencies(repo_info, commit.sha),
+                recent_commits)
             
-            commit_analysis = self.analyze_commit_for_dependencies(repo_info, commit['sha'])
-            if commit_analysis:
-                dependency_changes.append(commit_analysis)
+            for commit_analysis in commit_analyses:
+                if commit_analysis:
+                    dependency_changes.append(commit_analysis)
         
         analysis['commit_history'] = dependency_changes
         
@@ -619,9 +1110,9 @@ class DEPONPM:
         5. Check for claimed and unclaimed
         6. Provide detailed summary with paths
         """
-        print(f"\n{'='*80}")
+        print(f"\n{_HR80}")
         print(f"COMPLETE ORGANIZATION ANALYSIS: {org_name}")
-        print(f"{'='*80}")
+        print(_HR80)
         
         # Step 1: Collect all repositories
         print(f"\nSTEP 1: Collecting all repositories...")
@@ -633,12 +1124,20 @@ class DEPONPM:
         all_commits = {}
         total_commits = 0
         
-        for i, repo_info in enumerate(repos, 1):
-            print(f"  [{i}/{len(repos)}] Collecting commits from: {repo_info['name']}")
+        def collect_commits(repo_info):
+            # Only the newest commits are analyzed; the rest are just counted
             commits = self.get_all_repository_commits(repo_info)
-            all_commits[repo_info['name']] = commits
-            total_commits += len(commits)
-            print(f"    [OK] Found {len(commits)} commits")
+            newest = list(islice(commits, 100))
+            return newest, len(newest) + sum(1 for _ in commits)
+        
+        with ThreadPoolExecutor(max_workers=GITHUB_REPO_WORKERS) as executor:
+            repo_commits = executor.map(collect_commits, repos)
+            
+            for i, (repo_info, (commits, count)) in enumerate(zip(repos, repo_commits), 1):
+                print(f"  [{i}/{len(repos)}] Collecting commits from: {repo_info['name']}")
+                all_commits[repo_info['name']] = commits
+                total_commits += count
+                print(f"    [OK] Found {count} commits")
         
         print(f"[OK] Total commits collected: {total_commits}")
         
@@ -647,12 +1146,14 @@ class DEPONPM:
         all_deleted_commits = {}
         total_deleted = 0
         
-        for i, repo_info in enumerate(repos, 1):
-            print(f"  [{i}/{len(repos)}] Restoring deleted commits from: {repo_info['name']}")
-            deleted_commits = self.get_deleted_commits(repo_info)
-            all_deleted_commits[repo_info['name']] = deleted_commits
-            total_deleted += len(deleted_commits)
-            print(f"    [OK] Restored {len(deleted_commits)} deleted commits")
+        with ThreadPoolExecutor(max_workers=GITHUB_REPO_WORKERS) as executor:
+            repo_deleted_commits = executor.map(self.get_deleted_commits, repos)
+            
+            for i, (repo_info, deleted_commits) in enumerate(zip(repos, repo_deleted_commits), 1):
+                print(f"  [{i}/{len(repos)}] Restoring deleted commits from: {repo_info['name']}")
+                all_deleted_commits[repo_info['name']] = deleted_commits
+                total_deleted += len(deleted_commits)
+                print(f"    [OK] Restored {len(deleted_commits)} deleted commits")
         
         print(f"[OK] Total deleted commits restored: {total_deleted}")
         
@@ -661,37 +1162,42 @@ class DEPONPM:
         all_dependencies = {}
         dependency_sources = {}  # Track where each dependency was found
         
+        # Queue every lookup first, then run them on one pool shared by all
+        # repos: (repo position, repo_info, commit SHA or None, source label)
+        tasks = []
         for i, repo_info in enumerate(repos, 1):
-            print(f"  [{i}/{len(repos)}] Analyzing files from: {repo_info['name']}")
-            
             # Analyze current files
-            current_deps = self.analyze_repository_files(repo_info)
-            if current_deps:
-                all_dependencies[repo_info['name']] = current_deps
-                for dep in current_deps:
-                    if dep not in dependency_sources:
-                        dependency_sources[dep] = []
-                    dependency_sources[dep].append(f"{repo_info['name']} (current)")
+            tasks.append((i, repo_info, None, f"{repo_info['name']} (current)"))
             
             # Analyze commits for dependency changes
             repo_commits = all_commits.get(repo_info['name'], [])
-            for commit in repo_commits[:100]:  # Limit to prevent excessive API calls
-                commit_deps = self.analyze_commit_dependencies(repo_info, commit['sha'])
-                if commit_deps:
-                    for dep in commit_deps:
-                        if dep not in dependency_sources:
-                            dependency_sources[dep] = []
-                        dependency_sources[dep].append(f"{repo_info['name']} (commit: {commit['sha'][:8]})")
+            for commit in repo_commits:  # Newest 100, to prevent excessive API calls
+                tasks.append((i, repo_info, commit.sha, f"{repo_info['name']} (commit: {commit.sha[:8]})"))
             
             # Analyze deleted commits
             deleted_commits = all_deleted_commits.get(repo_info['name'], [])
             for commit in deleted_commits[:50]:  # Limit deleted commits analysis
-                commit_deps = self.analyze_commit_dependencies(repo_info, commit['sha'])
-                if commit_deps:
-                    for dep in commit_deps:
-                        if dep not in dependency_sources:
-                            dependency_sources[dep] = []
-                        dependency_sources[dep].append(f"{repo_info['name']} (deleted: {commit['sha'][:8]})")
+                tasks.append((i, repo_info, commit['sha'], f"{repo_info['name']} (deleted: {commit['sha'][:8]})"))
+        
+        def run_task(task):
+            _, repo_info, commit_sha, _ = task
+            if commit_sha is None:
+                return self.analyze_repository_files(repo_info)
+            return self.analyze_commit_dependencies(repo_info, commit_sha)
+        
+        with ThreadPoolExecutor(max_workers=GITHUB_ANALYSIS_WORKERS) as executor:
+            # Results arrive in task order, which keeps source lists stable
+            for task, deps in zip(tasks, executor.map(run_task, tasks)):
+                i, repo_info, commit_sha, source = task
+                if commit_sha is None:
+                    print(f"  [{i}/{len(repos)}] Analyzing files from: {repo_info['name']}")
+                    if deps:
+                        all_dependencies[repo_info['name']] = deps
+                
+                for dep in deps:
+                    if dep not in dependency_sources:
+                        dependency_sources[dep] = []
+                    dependency_sources[dep].append(source)
         
         print(f"[OK] Dependency analysis completed")
         
@@ -703,16 +1209,14 @@ class DEPONPM:
         unique_deps = set(dependency_sources.keys())
         print(f"  Checking {len(unique_deps)} unique dependencies...")
         
-        for i, dep in enumerate(sorted(unique_deps), 1):
-            print(f"  [{i}/{len(unique_deps)}] Checking {dep}...", end=' ')
-            exists, status = self.check_npm_package_exists(dep)
-            
-            if exists:
+        results = self.check_package_names(unique_deps, prefix="  ",
+                                           ok_label="CLAIMED", fail_label="UNCLAIMED")
+        
+        for dep, info in results.items():
+            if info['exists']:
                 claimed_deps.append((dep, dependency_sources[dep]))
-                print("CLAIMED")
             else:
-                unclaimed_deps.append((dep, dependency_sources[dep], status))
-                print("UNCLAIMED")
+                unclaimed_deps.append((dep, dependency_sources[dep], info['status']))
         
         # Step 6: Final summary
         print(f"\nSTEP 6: Generating final summary...")
@@ -734,51 +1238,28 @@ class DEPONPM:
             'dependency_sources': dependency_sources
         }
     
-    def get_all_repository_commits(self, repo_info: Dict) -> List[Dict]:
+    def get_all_repository_commits(self, repo_info: Dict) -> Iterator[CommitInfo]:
         """
         Get ALL commits from a repository (not limited by date).
+        
+        Commits are yielded page by page as they arrive, so callers that
+        only keep a few of them never hold the whole history.
         """
-        commits = []
-        page = 1
         per_page = 100
         
-        while True:
-            url = f"https://api.github.com/repos/{repo_info['full_name']}/commits"
-            params = {
-                'page': page,
-                'per_page': per_page
-            }
-            
-            try:
-                response = self.session.get(url, params=params, timeout=30)
-                response.raise_for_status()
-                
-                page_commits = response.json()
-                
-                if not page_commits:
-                    break
-                
+        url = f"https://api.github.com/repos/{repo_info['full_name']}/commits"
+        params = {
+            'per_page': per_page
+        }
+        
+        try:
+            # Limit to prevent excessive API calls (adjust as needed)
+            for page_commits in self._iter_pages(url, params, max_pages=1000 // per_page):
                 for commit in page_commits:
-                    commit_info = {
-                        'sha': commit['sha'],
-                        'message': commit['commit']['message'],
-                        'author': commit['commit']['author']['name'],
-                        'date': commit['commit']['author']['date'],
-                        'url': commit['html_url']
-                    }
-                    commits.append(commit_info)
-                
-                page += 1
+                    yield CommitInfo.from_api(commit)
                 
-                # Limit to prevent excessive API calls (adjust as needed)
-                if len(commits) >= 1000:
-                    break
-                    
-            except requests.RequestException as e:
-                print(f"    Error fetching commits: {e}")
-                break
-        
-        return commits
+        except (requests.RequestException, ValueError) as e:
+            print(f"    Error fetching commits: {e}")
     
     def analyze_repository_files(self, repo_info: Dict) -> List[str]:
         """
@@ -793,19 +1274,6 @@ class DEPONPM:
                 deps = self.extract_dependencies(package_data)
                 dependencies.extend(deps)
             
-            # Look for other package manager files
-            url = f"https://api.github.com/repos/{repo_info['full_name']}/contents"
-            response = self.session.get(url, timeout=30)
-            
-            if response.status_code == 200:
-                contents = response.json()
-                for item in contents:
-                    filename = item.get('name', '')
-                    if filename in ['yarn.lock', 'pnpm-lock.yaml', 'package-lock.json']:
-                        # These files contain dependency information
-                        # For now, we'll focus on package.json analysis
-                        pass
-            
         except requests.RequestException as e:
             print(f"    Error analyzing files: {e}")
         
@@ -815,14 +1283,19 @@ class DEPONPM:
         """
         Analyze a specific commit for dependencies.
         """
+        cache_key = (repo_info['full_name'], commit_sha)
+        cached = self._commit_dep_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         dependencies = []
         
         try:
             url = f"https://api.github.com/repos/{repo_info['full_name']}/commits/{commit_sha}"
-            response = self.session.get(url, timeout=30)
+            response = self._github_get(url, timeout=30, cache=False)
             response.raise_for_status()
             
-            commit_data = response.json()
+            commit_data = _loads(response.content)
             
             # Look for package.json changes
             for file_change in commit_data.get('files', []):
@@ -834,30 +1307,94 @@ class DEPONPM:
                         deps = self.extract_dependencies_from_patch(patch)
                         dependencies.extend(deps)
             
-        except requests.RequestException as e:
-            pass  # Skip errors for individual commits
+        except (requests.RequestException, ValueError) as e:
+            return dependencies  # Skip errors for individual commits
         
+        self._commit_dep_cache[cache_key] = dependencies
         return dependencies
     
-    def extract_dependencies_from_patch(self, patch: str) -> List[str]:
+    def _advance_patch_section(self, state: Tuple[Optional[str], int], text: str) -> Tuple[Optional[str], int]:
+        """
+        Track which package.json section a patch line leaves us in.
+        
+        Args:
+            state: Tuple of (section, depth); section is 'dep' inside a
+                dependency section, 'other' elsewhere, or None when the
+                hunk started somewhere we can't see
+            text: Line content without its diff marker
+            
+        Returns:
+            Updated (section, depth) state
         """
-        Extract dependency names from a git patch.
+        section, depth = state
+        structure = _JSON_STRING_RE.sub('', text)
+        delta = structure.count('{') - structure.count('}')
+        
+        if section is not None and depth > 0:
+            depth += delta
+            return (section, depth) if depth > 0 else ('other', 0)
+        
+        if delta > 0:
+            key = _JSON_KEY_RE.match(text)
+            if not key:
+                # The root object's opening brace
+                return 'other', 0
+            return ('dep' if key.group(1) in DEPENDENCY_SECTIONS else 'other'), delta
+        
+        if delta < 0:
+            # Closed a block opened before the hunk; we're back at the top level
+            return 'other', 0
+        
+        return section, depth
+    
+    def extract_dependency_changes_from_patch(self, patch: str) -> Tuple[Set[str], Set[str]]:
         """
-        dependencies = []
-        lines = patch.split('\n')
+        Extract added and removed dependency names from a package.json patch.
         
-        for line in lines:
-            if line.startswith('+') and '"' in line and ':' in line:
-                # Look for dependency lines like: +    "package-name": "version"
-                try:
-                    if line.strip().startswith('+    "') and '":' in line:
-                        dep_name = line.split('"')[1]
-                        if dep_name and not dep_name.startswith('@'):
-                            dependencies.append(dep_name)
-                except:
-                    pass
+        Entries are only counted inside dependency sections. The old and new
+        side of the diff are tracked separately, and each hunk restarts in an
+        unknown section; there the legacy 4-space indent heuristic is used
+        until a section boundary is seen.
         
-        return dependencies
+        Args:
+            patch: Unified diff of a package.json file
+            
+        Returns:
+            Tuple of (added, removed) dependency name sets
+        """
+        added = set()
+        removed = set()
+        old_state = new_state = (None, 0)
+        
+        for event in _PATCH_EVENT_RE.finditer(patch):
+            line = event.group(0)
+            if line.startswith('@@'):
+                old_state = new_state = (None, 0)
+                continue
+            
+            marker, text = line[:1], line[1:]
+            dep_name = event.group('dep')
+            if dep_name:
+                # A plain entry never opens or closes a block
+                section, depth = new_state if marker == '+' else old_state
+                if (section == 'dep' and depth == 1 or
+                        section is None and text.startswith('    "')):
+                    (added if marker == '+' else removed).add(dep_name)
+                continue
+            
+            if marker != '-':
+                new_state = self._advance_patch_section(new_state, text)
+            if marker != '+':
+                old_state = self._advance_patch_section(old_state, text)
+        
+        return added, removed
+    
+    def extract_dependencies_from_patch(self, patch: str) -> List[str]:
+        """
+        Extract dependency names added by a git patch.
+        """
+        added, _ = self.extract_dependency_changes_from_patch(patch)
+        return sorted(dep_name for dep_name in added if not dep_name.startswith('@'))
     
     def print_complete_analysis_summary(self, org_name: str, repos: List[Dict], 
                                       total_commits: int, total_deleted: int,
@@ -866,39 +1403,44 @@ class DEPONPM:
         """
         Print the final comprehensive summary.
         """
-        print(f"\n{'='*100}")
-        print(f"FINAL COMPREHENSIVE ANALYSIS SUMMARY")
-        print(f"{'='*100}")
+        # Collected and written in one go
+        lines = []
+        
+        lines.append(f"\n{_HR100}")
+        lines.append(f"FINAL COMPREHENSIVE ANALYSIS SUMMARY")
+        lines.append(_HR100)
         
-        print(f"\nORGANIZATION: {org_name}")
-        print(f"REPOSITORIES ANALYZED: {len(repos)}")
-        print(f"TOTAL COMMITS COLLECTED: {total_commits}")
-        print(f"TOTAL DELETED COMMITS RESTORED: {total_deleted}")
+        lines.append(f"\nORGANIZATION: {org_name}")
+        lines.append(f"REPOSITORIES ANALYZED: {len(repos)}")
+        lines.append(f"TOTAL COMMITS COLLECTED: {total_commits}")
+        lines.append(f"TOTAL DELETED COMMITS RESTORED: {total_deleted}")
         
         total_unique_deps = len(set(dependency_sources.keys()))
-        print(f"TOTAL UNIQUE DEPENDENCIES FOUND: {total_unique_deps}")
-        print(f"CLAIMED DEPENDENCIES: {len(claimed_deps)}")
-        print(f"UNCLAIMED DEPENDENCIES: {len(unclaimed_deps)}")
+        lines.append(f"TOTAL UNIQUE DEPENDENCIES FOUND: {total_unique_deps}")
+        lines.append(f"CLAIMED DEPENDENCIES: {len(claimed_deps)}")
+        lines.append(f"UNCLAIMED DEPENDENCIES: {len(unclaimed_deps)}")
         
-        print(f"\n{'='*100}")
-        print(f"DETAILED DEPENDENCY BREAKDOWN")
-        print(f"{'='*100}")
+        lines.append(f"\n{_HR100}")
+        lines.append(f"DETAILED DEPENDENCY BREAKDOWN")
+        lines.append(_HR100)
         
-        print(f"\nCLAIMED DEPENDENCIES ({len(claimed_deps)}):")
+        lines.append(f"\nCLAIMED DEPENDENCIES ({len(claimed_deps)}):")
         for dep, sources in claimed_deps:
-            print(f"\n  [CLAIMED] {dep}")
+            lines.append(f"\n  [CLAIMED] {dep}")
             for source in sources:
-                print(f"    -> Found in: {source}")
+                lines.append(f"    -> Found in: {source}")
         
-        print(f"\nUNCLAIMED DEPENDENCIES ({len(unclaimed_deps)}):")
+        lines.append(f"\nUNCLAIMED DEPENDENCIES ({len(unclaimed_deps)}):")
         for dep, sources, status in unclaimed_deps:
-            print(f"\n  [UNCLAIMED] {dep} ({status})")
+            lines.append(f"\n  [UNCLAIMED] {dep} ({status})")
             for source in sources:
-                print(f"    -> Found in: {source}")
+                lines.append(f"    -> Found in: {source}")
         
-        print(f"\n{'='*100}")
-        print(f"ANALYSIS COMPLETE")
-        print(f"{'='*100}")
+        lines.append(f"\n{_HR100}")
+        lines.append(f"ANALYSIS COMPLETE")
+        lines.append(_HR100)
+        
+        print("\n".join(lines))
     
     def process_github_organization_comprehensive(self, org_name: str) -> Dict[str, Dict]:
         """
@@ -915,11 +1457,17 @@ class DEPONPM:
         
         print(f"\nPerforming comprehensive analysis on {len(repos)} repositories...")
         
-        for i, repo_info in enumerate(repos, 1):
-            print(f"\n[{i}/{len(repos)}] Comprehensive analysis: {repo_info['name']}")
+        # Repositories are analyzed concurrently, so progress is reported here,
+        # in repository order, rather than from inside the workers
+        with ThreadPoolExecutor(max_workers=GITHUB_REPO_WORKERS) as executor:
+            analyses = executor.map(self.comprehensive_repository_analysis, repos)
             
-            analysis = self.comprehensive_repository_analysis(repo_info)
-            all_analyses[repo_info['name']] = analysis
+            for i, (repo_info, analysis) in enumerate(zip(repos, analyses), 1):
+                print(f"\n[{i}/{len(repos)}] Comprehensive analysis: {repo_info['name']}")
+                print(f"  Found {analysis['total_commits_analyzed']} commits, "
+                      f"{len(analysis['commit_history'])} with dependency changes, "
+                      f"{len(analysis['deleted_commits'])} deleted commits")
+                all_analyses[repo_info['name']] = analysis
         
         return all_analyses
     
@@ -930,64 +1478,69 @@ class DEPONPM:
         Args:
             all_analyses: Dictionary mapping repository names to their analysis results
         """
-        print("\n" + "="*100)
-        print("COMPREHENSIVE DEPENDENCY ANALYSIS RESULTS")
-        print("="*100)
+        # Collected and written in one go
+        lines = []
+        
+        lines.append("\n" + _HR100)
+        lines.append("COMPREHENSIVE DEPENDENCY ANALYSIS RESULTS")
+        lines.append(_HR100)
         
         total_repos = len(all_analyses)
         repos_with_deps = sum(1 for analysis in all_analyses.values() if analysis['current_dependencies'])
         total_commits_analyzed = sum(analysis['total_commits_analyzed'] for analysis in all_analyses.values())
         
-        print(f"\nOVERVIEW:")
-        print(f"  Total repositories analyzed: {total_repos}")
-        print(f"  Repositories with dependencies: {repos_with_deps}")
-        print(f"  Total commits analyzed: {total_commits_analyzed}")
+        lines.append(f"\nOVERVIEW:")
+        lines.append(f"  Total repositories analyzed: {total_repos}")
+        lines.append(f"  Repositories with dependencies: {repos_with_deps}")
+        lines.append(f"  Total commits analyzed: {total_commits_analyzed}")
         
         # Aggregate all current dependencies
         all_current_deps = set()
         for analysis in all_analyses.values():
             all_current_deps.update(analysis['current_dependencies'].keys())
         
-        print(f"  Total unique dependencies found: {len(all_current_deps)}")
+        lines.append(f"  Total unique dependencies found: {len(all_current_deps)}")
         
         # Show dependency changes over time
-        print(f"\nDEPENDENCY CHANGES OVER TIME:")
+        lines.append(f"\nDEPENDENCY CHANGES OVER TIME:")
         total_dependency_changes = 0
         for repo_name, analysis in all_analyses.items():
             if analysis['commit_history']:
                 changes_count = len(analysis['commit_history'])
                 total_dependency_changes += changes_count
-                print(f"  {repo_name}: {changes_count} commits with dependency changes")
+                lines.append(f"  {repo_name}: {changes_count} commits with dependency changes")
         
-        print(f"  Total dependency-related commits: {total_dependency_changes}")
+        lines.append(f"  Total dependency-related commits: {total_dependency_changes}")
         
         # Show deleted commits
-        print(f"\nDELETED COMMITS ANALYSIS:")
+        lines.append(f"\nDELETED COMMITS ANALYSIS:")
         total_deleted_commits = 0
         for repo_name, analysis in all_analyses.items():
             if analysis['deleted_commits']:
                 deleted_count = len(analysis['deleted_commits'])
                 total_deleted_commits += deleted_count
-                print(f"  {repo_name}: {deleted_count} deleted commits")
+                lines.append(f"  {repo_name}: {deleted_count} deleted commits")
         
-        print(f"  Total deleted commits found: {total_deleted_commits}")
+        lines.append(f"  Total deleted commits found: {total_deleted_commits}")
         
         # Detailed repository analysis
-        print(f"\nDETAILED REPOSITORY ANALYSIS:")
+        lines.append(f"\nDETAILED REPOSITORY ANALYSIS:")
         for repo_name, analysis in all_analyses.items():
-            print(f"\n  Repository: {repo_name}")
-            print(f"    Current dependencies: {len(analysis['current_dependencies'])}")
-            print(f"    Commits analyzed: {analysis['total_commits_analyzed']}")
-            print(f"    Dependency changes: {len(analysis['commit_history'])}")
-            print(f"    Deleted commits: {len(analysis['deleted_commits'])}")
+            lines.append(f"\n  Repository: {repo_name}")
+            lines.append(f"    Current dependencies: {len(analysis['current_dependencies'])}")
+            lines.append(f"    Commits analyzed: {analysis['total_commits_analyzed']}")
+            lines.append(f"    Dependency changes: {len(analysis['commit_history'])}")
+            lines.append(f"    Deleted commits: {len(analysis['deleted_commits'])}")
             
             # Show recent dependency changes
             if analysis['commit_history']:
-                print(f"    Recent dependency changes:")
+                lines.append(f"    Recent dependency changes:")
                 for change in analysis['commit_history'][:5]:  # Show last 5 changes
                     date_str = change['date'][:10]  # Just the date part
-                    print(f"      - {date_str}: {change['message'][:60]}...")
-                    print(f"        Commit: {change['url']}")
+                    lines.append(f"      - {date_str}: {change['message'][:60]}...")
+                    lines.append(f"        Commit: {change['url']}")
+        
+        print("\n".join(lines))
     
     def print_results(self, results: Dict[str, Dict], source_name: str = ""):
         """
@@ -1007,13 +1560,13 @@ class DEPONPM:
                 unclaimed.append((dep_name, info['status']))
         
         if source_name:
-            print(f"\n" + "="*60)
+            print("\n" + _HR60)
             print(f"RESULTS FOR: {source_name}")
-            print("="*60)
+            print(_HR60)
         else:
-            print("\n" + "="*60)
+            print("\n" + _HR60)
             print("DEPENDENCY CHECK RESULTS")
-            print("="*60)
+            print(_HR60)
         
         print(f"\nCLAIMED DEPENDENCIES ({len(claimed)}):")
         if claimed:
@@ -1041,58 +1594,58 @@ class DEPONPM:
         Args:
             all_results: Dictionary mapping source names to their results
         """
-        # Aggregate all dependencies
-        all_deps = set()
-        dep_sources = {}  # Track which source each dependency comes from
+        # Aggregate all dependencies, tracking which sources each comes from
+        dep_sources = defaultdict(set)
+        claimed_set = set()  # Dependencies that exist according to any source
         
         for source_name, results in all_results.items():
-            for dep_name in results.keys():
-                all_deps.add(dep_name)
-                if dep_name not in dep_sources:
-                    dep_sources[dep_name] = []
-                dep_sources[dep_name].append(source_name)
+            for dep_name, info in results.items():
+                dep_sources[dep_name].add(source_name)
+                if info['exists']:
+                    claimed_set.add(dep_name)
         
         # Check each unique dependency
         claimed = []
         unclaimed = []
         
-        for dep_name in sorted(all_deps):
-            # Check if dependency exists in any source
-            exists_anywhere = any(results[dep_name]['exists'] for results in all_results.values() if dep_name in results)
-            
-            if exists_anywhere:
-                claimed.append((dep_name, dep_sources[dep_name]))
+        for dep_name in sorted(dep_sources):
+            sources = sorted(dep_sources[dep_name])
+            if dep_name in claimed_set:
+                claimed.append((dep_name, sources))
             else:
                 # Get status from first source that has this dependency
-                first_source = dep_sources[dep_name][0]
-                status = all_results[first_source][dep_name]['status']
-                unclaimed.append((dep_name, status, dep_sources[dep_name]))
+                status = all_results[sources[0]][dep_name]['status']
+                unclaimed.append((dep_name, status, sources))
         
-        print("\n" + "="*80)
-        print("AGGREGATED DEPENDENCY CHECK RESULTS")
-        print("="*80)
+        # Collected and written in one go
+        lines = []
+        lines.append("\n" + _HR80)
+        lines.append("AGGREGATED DEPENDENCY CHECK RESULTS")
+        lines.append(_HR80)
         
-        print(f"\nCLAIMED DEPENDENCIES ({len(claimed)}):")
+        lines.append(f"\nCLAIMED DEPENDENCIES ({len(claimed)}):")
         if claimed:
             for dep, sources in claimed:
                 sources_str = ", ".join(sources)
-                print(f"  - {dep} (from: {sources_str})")
+                lines.append(f"  - {dep} (from: {sources_str})")
         else:
-            print("  None")
+            lines.append("  None")
         
-        print(f"\nUNCLAIMED DEPENDENCIES ({len(unclaimed)}):")
+        lines.append(f"\nUNCLAIMED DEPENDENCIES ({len(unclaimed)}):")
         if unclaimed:
             for dep, status, sources in unclaimed:
                 sources_str = ", ".join(sources)
-                print(f"  - {dep} ({status}) (from: {sources_str})")
+                lines.append(f"  - {dep} ({status}) (from: {sources_str})")
         else:
-            print("  None")
+            lines.append("  None")
         
-        print(f"\nAGGREGATED SUMMARY:")
-        print(f"  Total unique dependencies: {len(all_deps)}")
-        print(f"  Claimed: {len(claimed)}")
-        print(f"  Unclaimed: {len(unclaimed)}")
-        print(f"  Sources processed: {len(all_results)}")
+        lines.append(f"\nAGGREGATED SUMMARY:")
+        lines.append(f"  Total unique dependencies: {len(dep_sources)}")
+        lines.append(f"  Claimed: {len(claimed)}")
+        lines.append(f"  Unclaimed: {len(unclaimed)}")
+        lines.append(f"  Sources processed: {len(all_results)}")
+        
+        print("\n".join(lines))
 
 
 def main():
@@ -1166,10 +1719,17 @@ Examples:
         help='Perform complete analysis: collect all repos, all commits, restore deleted commits, analyze all files, collect all dependencies, check claimed/unclaimed with detailed paths'
     )
     
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write the on-disk cache of GitHub API responses and commit dependencies'
+    )
+    
     args = parser.parse_args()
     
     # Initialize checker with GitHub token if provided
-    checker = DEPONPM(github_token=args.token)
+    checker = DEPONPM(github_token=args.token,
+                      cache_file=None if args.no_cache else ETAG_CACHE_FILE)
     
     try:
         if args.org:
@@ -1332,6 +1892,8 @@ Examples:
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        checker.save_cache()
 
 
 if __name__ == "__main__":
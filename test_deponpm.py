@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Regression tests for deponpm.py.
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import requests
+
+import deponpm
+from deponpm import DEPONPM
+
+
+API_URL = 'https://api.github.com/orgs/acme/repos'
+
+
+def make_response(status=200, body=None, headers=None):
+    """Build a requests.Response without touching the network."""
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(body).encode() if body is not None else b''
+    response.headers.update(headers or {})
+    return response
+
+
+class StubSession:
+    """Stands in for requests.Session, answering GETs from a handler."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.headers = {}
+        self.requests = []
+
+    def get(self, url, params=None, headers=None, timeout=None, **kwargs):
+        self.requests.append((url, dict(params or {}), headers))
+        return self.handler(url, params or {}, headers)
+
+
+class PatchParserTest(unittest.TestCase):
+    """Dependency changes found in package.json patches."""
+
+    def setUp(self):
+        self.checker = DEPONPM(cache_file=None)
+
+    def changes(self, *lines):
+        return self.checker.extract_dependency_changes_from_patch('\n'.join(lines))
+
+    def test_dependency_entries(self):
+        added, removed = self.changes(
+            '@@ -1,6 +1,6 @@',
+            ' {',
+            '   "name": "app",',
+            '   "dependencies": {',
+            '-    "left-pad": "^1.0.0",',
+            '+    "right-pad": "^1.0.0",',
+            '     "lodash": "^4.17.21"',
+            '   }',
+            ' }',
+        )
+        self.assertEqual(added, {'right-pad'})
+        self.assertEqual(removed, {'left-pad'})
+
+    def test_scripts_and_config_are_ignored(self):
+        added, removed = self.changes(
+            '@@ -1,9 +1,9 @@',
+            ' {',
+            '   "scripts": {',
+            '-    "build": "tsc",',
+            '+    "build": "tsc -p .",',
+            '+    "lint": "eslint ."',
+            '   },',
+            '   "config": {',
+            '+    "port": "8080"',
+            '   },',
+            '   "devDependencies": {',
+            '+    "eslint": "^8.0.0"',
+            '   }',
+            ' }',
+        )
+        self.assertEqual(added, {'eslint'})
+        self.assertEqual(removed, set())
+
+    def test_hunk_starting_mid_section(self):
+        # The section header is outside the hunk; entries at the usual
+        # 4-space indent count until a section boundary is seen
+        added, _ = self.changes(
+            '@@ -10,7 +10,8 @@',
+            '     "express": "^4.18.0",',
+            '+    "left-pad": "^1.0.0",',
+            '     "react": "^18.0.0"',
+            '   },',
+            '   "scripts": {',
+            '+    "start": "node index.js"',
+            '   }',
+        )
+        self.assertEqual(added, {'left-pad'})
+
+    def test_hunk_starting_mid_nested_block(self):
+        # Deeper entries of a block we can't see are not dependencies
+        added, _ = self.changes(
+            '@@ -20,4 +20,5 @@',
+            '       "target": "es2020",',
+            '+      "module": "commonjs"',
+            '     }',
+        )
+        self.assertEqual(added, set())
+
+    def test_tab_indentation(self):
+        added, _ = self.changes(
+            '@@ -1,5 +1,6 @@',
+            ' {',
+            ' \t"dependencies": {',
+            '+\t\t"left-pad": "^1.0.0",',
+            ' \t\t"lodash": "^4.17.21"',
+            ' \t}',
+            ' }',
+        )
+        self.assertEqual(added, {'left-pad'})
+
+    def test_new_section(self):
+        added, removed = self.changes(
+            '@@ -1,4 +1,7 @@',
+            ' {',
+            '-  "name": "app"',
+            '+  "name": "app",',
+            '+  "peerDependencies": {',
+            '+    "react": ">=17"',
+            '+  }',
+            ' }',
+        )
+        self.assertEqual(added, {'react'})
+        self.assertEqual(removed, set())
+
+    def test_sides_are_tracked_separately(self):
+        # Moving entries from scripts into dependencies only adds on the new side
+        added, removed = self.changes(
+            '@@ -1,5 +1,5 @@',
+            ' {',
+            '-  "scripts": {',
+            '+  "dependencies": {',
+            '-    "serve": "^14.0.0"',
+            '+    "serve": "^14.0.0"',
+            '   }',
+            ' }',
+        )
+        self.assertEqual(added, {'serve'})
+        self.assertEqual(removed, set())
+
+    def test_added_names_skip_scoped_packages(self):
+        patch = '\n'.join([
+            '@@ -1,3 +1,6 @@',
+            ' {',
+            '   "dependencies": {',
+            '+    "zod": "^3.0.0",',
+            '+    "@types/node": "^20.0.0",',
+            '+    "axios": "^1.0.0"',
+            '   }',
+            ' }',
+        ])
+        self.assertEqual(self.checker.extract_dependencies_from_patch(patch), ['axios', 'zod'])
+
+
+def page_link(page):
+    return f'<{API_URL}?per_page=100&page={page}>'
+
+
+class PaginationTest(unittest.TestCase):
+    """Page walking in _iter_pages."""
+
+    def setUp(self):
+        self.checker = DEPONPM(cache_file=None)
+
+    def serve(self, pages, links):
+        """Serve pages[n - 1] for page n, with links[n] as its Link header."""
+        def handler(url, params, headers):
+            page = params['page']
+            if page > len(pages):
+                return make_response(body=[])
+            link = links.get(page)
+            return make_response(body=pages[page - 1], headers={'Link': link} if link else {})
+        self.checker.session = StubSession(handler)
+
+    def walk(self, max_pages=None):
+        return list(self.checker._iter_pages(API_URL, {'per_page': 100}, max_pages=max_pages))
+
+    def requested_pages(self):
+        return sorted(params['page'] for _, params, _ in self.checker.session.requests)
+
+    def test_last_link_fetches_every_page_in_order(self):
+        self.serve([[1], [2], [3]], {1: f'{page_link(2)}; rel="next", {page_link(3)}; rel="last"'})
+        self.assertEqual(self.walk(), [[1], [2], [3]])
+        self.assertEqual(self.requested_pages(), [1, 2, 3])
+
+    def test_max_pages_clamps_last_link(self):
+        self.serve([[1], [2], [3], [4], [5]], {1: f'{page_link(2)}; rel="next", {page_link(5)}; rel="last"'})
+        self.assertEqual(self.walk(max_pages=2), [[1], [2]])
+        self.assertEqual(self.requested_pages(), [1, 2])
+
+    def test_next_links_are_followed_serially(self):
+        self.serve([[1], [2], [3]], {1: f'{page_link(2)}; rel="next"', 2: f'{page_link(3)}; rel="next"'})
+        self.assertEqual(self.walk(max_pages=10), [[1], [2], [3]])
+        self.assertEqual(self.requested_pages(), [1, 2, 3])
+
+    def test_max_pages_stops_next_links(self):
+        self.serve([[1], [2], [3]], {1: f'{page_link(2)}; rel="next"', 2: f'{page_link(3)}; rel="next"'})
+        self.assertEqual(self.walk(max_pages=2), [[1], [2]])
+        self.assertEqual(self.requested_pages(), [1, 2])
+
+    def test_single_page(self):
+        self.serve([[1]], {})
+        self.assertEqual(self.walk(max_pages=10), [[1]])
+        self.assertEqual(self.requested_pages(), [1])
+
+    def test_empty_first_page(self):
+        self.serve([[]], {})
+        self.assertEqual(self.walk(), [])
+
+    def test_empty_page_ends_walk(self):
+        self.serve([[1], [], [3]], {1: f'{page_link(2)}; rel="next", {page_link(3)}; rel="last"'})
+        self.assertEqual(self.walk(), [[1]])
+
+    def test_page_errors_propagate(self):
+        def handler(url, params, headers):
+            if params['page'] == 1:
+                return make_response(body=[1], headers={
+                    'Link': f'{page_link(2)}; rel="next", {page_link(2)}; rel="last"'})
+            return make_response(status=500, body={'message': 'Server Error'})
+        self.checker.session = StubSession(handler)
+        with self.assertRaises(requests.HTTPError):
+            self.walk()
+
+
+class EtagCacheTest(unittest.TestCase):
+    """Conditional requests and the response cache in _github_get."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_file = Path(self.tmp_dir.name) / 'etags.pickle'
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_not_modified_replays_cached_body_and_link(self):
+        link = f'{page_link(2)}; rel="next"'
+        first = DEPONPM(cache_file=self.cache_file)
+        first.session = StubSession(lambda url, params, headers: make_response(
+            body=[{'name': 'app'}], headers={'ETag': '"abc"', 'Link': link}))
+        first._github_get(API_URL, params={'page': 1})
+        first.save_cache()
+
+        second = DEPONPM(cache_file=self.cache_file)
+        second.session = StubSession(lambda url, params, headers: make_response(status=304))
+        response = second._github_get(API_URL, params={'page': 1})
+
+        _, _, headers = second.session.requests[0]
+        self.assertEqual(headers, {'If-None-Match': '"abc"'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [{'name': 'app'}])
+        self.assertEqual(response.links['next']['url'], f'{API_URL}?per_page=100&page=2')
+
+    def test_uncached_requests_are_not_stored(self):
+        checker = DEPONPM(cache_file=None)
+        checker.session = StubSession(lambda url, params, headers: make_response(
+            body={'sha': 'abc'}, headers={'ETag': '"abc"'}))
+        checker._github_get(API_URL, cache=False)
+        self.assertEqual(checker._etag_cache, {})
+
+    def test_size_limit_drops_least_recently_used(self):
+        checker = DEPONPM(cache_file=None)
+        checker.session = StubSession(lambda url, params, headers: make_response(
+            body='x' * 8, headers={'ETag': '"tag"'}))
+        with mock.patch.object(deponpm, 'ETAG_CACHE_MAX_BYTES', 25):
+            checker._github_get(API_URL, params={'page': 1})
+            checker._github_get(API_URL, params={'page': 2})
+            # Revalidating page 1 makes page 2 the least recently used
+            checker.session = StubSession(lambda url, params, headers: make_response(status=304))
+            checker._github_get(API_URL, params={'page': 1})
+            checker.session = StubSession(lambda url, params, headers: make_response(
+                body='y' * 8, headers={'ETag': '"tag"'}))
+            checker._github_get(API_URL, params={'page': 3})
+
+        pages = sorted(key.rsplit('=', 1)[1] for key in checker._etag_cache)
+        self.assertEqual(pages, ['1', '3'])
+        self.assertEqual(checker._etag_cache_bytes, 20)
+
+
+class RateLimitTest(unittest.TestCase):
+    """GitHub quota bookkeeping."""
+
+    def setUp(self):
+        self.checker = DEPONPM(cache_file=None)
+
+    def test_only_github_api_responses_are_tracked(self):
+        self.assertEqual(self.checker.session.hooks['response'], [])
+
+    def test_github_adapter_leaves_rate_limits_to_github_get(self):
+        retries = self.checker.session.get_adapter(API_URL).max_retries
+        self.assertFalse(retries.is_retry('GET', 429))
+        self.assertTrue(retries.is_retry('GET', 502))
+        registry = self.checker.session.get_adapter('https://registry.npmjs.org/left-pad')
+        self.assertTrue(registry.max_retries.is_retry('HEAD', 429))
+
+    def test_quota_headers_are_recorded(self):
+        self.checker.session = StubSession(lambda url, params, headers: make_response(
+            body={}, headers={'X-RateLimit-Remaining': '4000', 'X-RateLimit-Reset': '1700000000'}))
+        self.checker._github_get(API_URL)
+        self.assertEqual(self.checker._rate_limit_state, (4000, 1700000000))
+
+    def test_malformed_quota_headers_are_ignored(self):
+        self.checker.session = StubSession(lambda url, params, headers: make_response(
+            body={}, headers={'X-RateLimit-Remaining': 'lots', 'X-RateLimit-Reset': 'soon'}))
+        response = self.checker._github_get(API_URL)
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(self.checker._rate_limit_state)
+
+
+if __name__ == '__main__':
+    unittest.main()